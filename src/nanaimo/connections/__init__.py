@@ -24,7 +24,9 @@ classes use connections to bind to physical hardware.
 """
 import asyncio
 import codecs
+import collections
 import queue
+import threading
 import typing
 
 import nanaimo
@@ -36,14 +38,17 @@ class TimestampedLine(str):
     object may be treated as a string without conversion.
     """
 
+    __slots__ = ('_timestamp_seconds',)
+
     @classmethod
     def create(cls, line_text: object, timestamp_seconds: float) -> 'TimestampedLine':
-        timestamped = TimestampedLine(line_text)
-        timestamped._timestamp_seconds = timestamp_seconds
-        return timestamped
+        return cls(line_text, timestamp_seconds)
+
+    def __new__(cls, line_text: object, timestamp_seconds: float = 0.0) -> 'TimestampedLine':
+        return super().__new__(cls, line_text)
 
-    def __init__(self, line_text: object):
-        self._timestamp_seconds = 0.0
+    def __init__(self, line_text: object, timestamp_seconds: float = 0.0):
+        self._timestamp_seconds = timestamp_seconds
 
     @property
     def timestamp_seconds(self) -> float:
@@ -75,14 +80,23 @@ class AbstractAsyncSerial(AbstractSerial):
     asynchronous methods.
     """
 
+    ReadBufferMaxLines = 4096
+    """
+    The maximum number of received lines buffered before the oldest are dropped (see :meth:`rx_buffer_overflows`).
+    """
+
     def __init__(self, loop: typing.Optional[asyncio.AbstractEventLoop] = None) -> None:
         self._loop = (loop if loop is not None else asyncio.get_event_loop())
-        self._read_buffer = queue.Queue()  # type: queue.Queue[TimestampedLine]
+        # Lines are appended by a single producer and popped by consumers on the event loop. deque's
+        # append and popleft are atomic so the read buffer doesn't need queue.Queue's locking. Once full
+        # the deque drops the oldest line for each new one so a stalled consumer can't grow it without bound.
+        self._read_buffer = collections.deque(maxlen=self.ReadBufferMaxLines)  # type: typing.Deque[TimestampedLine]
         self._write_buffer = queue.Queue()  # type: queue.Queue[str]
-        self._rx_decoder = codecs.getincrementaldecoder('UTF-8')('replace')
         self._tx_encoder = codecs.getincrementalencoder('UTF-8')('replace')
         self._queues_are_running = True
         self._rx_buffer_overflows = 0
+        self._rx_waiters = []  # type: typing.List[typing.Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+        self._rx_waiters_lock = threading.Lock()
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -90,10 +104,14 @@ class AbstractAsyncSerial(AbstractSerial):
 
     @property
     def rx_buffer_overflows(self) -> int:
+        """
+        The number of received lines dropped, oldest first, because the read buffer was full.
+        """
         return self._rx_buffer_overflows
 
     def stop(self) -> None:
         self._queues_are_running = False
+        self._notify_rx_waiters()
 
     def time(self) -> float:
         """
@@ -115,16 +133,48 @@ class AbstractAsyncSerial(AbstractSerial):
         :raises asyncio.TimeoutError: If a full line of text was not received within
             the specified timeout period.
         """
-        start_time = self.time()
+        deadline = (self.time() + timeout_seconds if timeout_seconds is not None else None)
         while True:
+            with self._rx_waiters_lock:
+                try:
+                    return self._read_buffer.popleft()
+                except IndexError:
+                    if not self._queues_are_running:
+                        raise queue.Empty()
+                rx_loop = asyncio.get_event_loop()
+                rx_waiter = rx_loop.create_future()
+                self._rx_waiters.append((rx_loop, rx_waiter))
             try:
-                return self._read_buffer.get_nowait()
-            except queue.Empty:
-                if not self._queues_are_running:
-                    raise
-                if timeout_seconds is not None and self.time() - start_time > timeout_seconds:
-                    raise asyncio.TimeoutError()
-                await asyncio.sleep(0.001)
+                if deadline is None:
+                    await rx_waiter
+                else:
+                    await asyncio.wait_for(rx_waiter, max(0.0, deadline - self.time()))
+            finally:
+                with self._rx_waiters_lock:
+                    if (rx_loop, rx_waiter) in self._rx_waiters:
+                        self._rx_waiters.remove((rx_loop, rx_waiter))
+
+    def _notify_rx_waiters(self) -> None:
+        """
+        Wake any coroutines waiting in :meth:`get_line`. Subclasses must call this after adding lines
+        to the read buffer or after the queues stop running. This method is safe to call from any thread.
+        """
+        with self._rx_waiters_lock:
+            if len(self._rx_waiters) == 0:
+                return
+            rx_waiters = self._rx_waiters
+            self._rx_waiters = []
+        for rx_loop, rx_waiter in rx_waiters:
+            try:
+                rx_loop.call_soon_threadsafe(self._wake_rx_waiter, rx_waiter)
+            except RuntimeError:
+                # The waiter's loop was closed.
+                pass
+
+    @staticmethod
+    def _wake_rx_waiter(rx_waiter: asyncio.Future) -> None:
+        if not rx_waiter.done():
+            rx_waiter.set_result(None)
 
     async def put_line(self, input_line: str, timeout_seconds: typing.Optional[float] = None) -> float:
         """
@@ -137,14 +187,17 @@ class AbstractAsyncSerial(AbstractSerial):
         :return: The monotonic system time that the line was put into the serial buffers at (see :meth:`time`).
         :raises asyncio.TimeoutError: If an input buffer did not become available within the specified timeout.
         """
-        start_time = self.time()
+        deadline = None  # type: typing.Optional[float]
         while self._queues_are_running:
+            start_of_put = self.time()
             try:
-                start_of_put = self.time()
                 self._write_buffer.put_nowait(input_line)
                 return start_of_put
             except queue.Full:
-                if timeout_seconds is not None and self.time() - start_time > timeout_seconds:
-                    raise asyncio.TimeoutError()
+                if timeout_seconds is not None:
+                    if deadline is None:
+                        deadline = start_of_put + timeout_seconds
+                    elif start_of_put > deadline:
+                        raise asyncio.TimeoutError()
                 await asyncio.sleep(0.001)
         return self.time()
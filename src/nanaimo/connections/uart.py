@@ -21,7 +21,6 @@ import asyncio
 import concurrent.futures
 import logging
 import queue
-import re
 import threading
 import types
 import typing
@@ -55,8 +54,9 @@ class ConcurrentUart(AbstractAsyncSerial):
         self._s = serial_port
         self._echo = echo
         self._eol = eol
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-        self._serial_futures = []  # type: typing.List[concurrent.futures.Future]
+        self._eol_bytes = eol.encode('utf-8')
+        self._serial_threads = []  # type: typing.List[threading.Thread]
+        self._serial_thread_exception = None  # type: typing.Optional[BaseException]
         self._logger_tx = logging.getLogger(type(self).__name__ + "_tx")
         self._logger_rx = logging.getLogger(type(self).__name__ + "_rx")
         self._extra_verbose = False
@@ -72,6 +72,7 @@ class ConcurrentUart(AbstractAsyncSerial):
     @eol.setter
     def eol(self, eol: str) -> None:
         self._eol = eol
+        self._eol_bytes = eol.encode('utf-8')
 
     @property
     def echo(self) -> bool:
@@ -104,8 +105,11 @@ class ConcurrentUart(AbstractAsyncSerial):
     def __enter__(self) -> 'ConcurrentUart':
         if not self._s.is_open:
             self._s.open()
-        self._serial_futures.append(self._executor.submit(self._buffer_input))
-        self._serial_futures.append(self._executor.submit(self._buffer_output))
+        # These run for the lifetime of the context so they get dedicated threads rather than an executor.
+        self._serial_threads = [threading.Thread(target=self._buffer_input, name=self._logger_rx.name, daemon=True),
+                                threading.Thread(target=self._buffer_output, name=self._logger_tx.name, daemon=True)]
+        for serial_thread in self._serial_threads:
+            serial_thread.start()
 
         return self
 
@@ -117,11 +121,18 @@ class ConcurrentUart(AbstractAsyncSerial):
         self._s.flush()
         self._s.cancel_read()
         self._write_buffer.put_nowait(self.WriteBufferEndOfTransmission)
-        for serial_future in reversed(self._serial_futures):
-            if not serial_future.done():
-                serial_future.result((self._s.timeout if self._s.timeout > 0 else None))
+        join_timeout = (self._s.timeout if self._s.timeout > 0 else None)
+        for serial_thread in reversed(self._serial_threads):
+            serial_thread.join(join_timeout)
+            if serial_thread.is_alive():
+                # Don't close the port out from under a thread that is still using it.
+                raise concurrent.futures.TimeoutError('{} did not stop within {} seconds.'.format(
+                    serial_thread.name, join_timeout))
         self._s.close()
-        self._executor.shutdown(wait=True)
+        if self._serial_thread_exception is not None:
+            serial_thread_exception = self._serial_thread_exception
+            self._serial_thread_exception = None
+            raise serial_thread_exception
 
     # +-----------------------------------------------------------------------+
     # | CONCURRENT OPERATIONS
@@ -134,9 +145,13 @@ class ConcurrentUart(AbstractAsyncSerial):
         :returns: A line of text with the time it was received at.
         :rtype: TimestampedLine
         """
+        # Check before popping so polling an empty buffer doesn't raise and catch an exception each time.
+        # The try still covers another consumer emptying the buffer between the two.
+        if len(self._read_buffer) == 0:
+            return None
         try:
-            return self._read_buffer.get_nowait()
-        except queue.Empty:
+            return self._read_buffer.popleft()
+        except IndexError:
             return None
 
     def writeline(self, input_line: str, end: typing.Optional[str] = None) -> float:
@@ -158,53 +173,78 @@ class ConcurrentUart(AbstractAsyncSerial):
     # | PRIVATE
     # +-----------------------------------------------------------------------+
 
+    def _set_serial_thread_exception(self, exception: BaseException) -> None:
+        # Keep the first failure; it's re-raised from __exit__ once both threads have stopped.
+        if self._serial_thread_exception is None:
+            self._serial_thread_exception = exception
+
     def _buffer_input(self) -> None:
         try:
-            local_storage = threading.local()
-            local_storage.line_buffer = ''
+            rx_accumulator = bytearray()
             while self._queues_are_running:
-                self._buffer_input_step(local_storage)
+                self._buffer_input_step(rx_accumulator)
+        except Exception as e:
+            self._set_serial_thread_exception(e)
         finally:
             if self._queues_are_running:
                 self._logger_rx.error("read thread exiting.")
             self._queues_are_running = False
+            self._notify_rx_waiters()
 
-    def _buffer_input_step(self, local_storage: threading.local) -> None:
-        raw_input = self._s.read()
+    def _buffer_input_step(self, rx_accumulator: bytearray) -> None:
+        # Block for at least one byte (up to the port's timeout) then drain whatever else the port
+        # has already buffered in the same call.
+        raw_input = self._s.read(max(1, self._s.in_waiting))
         rx_timestamp_seconds = self.time()
-        decoded_input = local_storage.line_buffer + self._rx_decoder.decode(raw_input)
-        local_storage.line_buffer = ''
-        decoded_lines = decoded_input.split(self._eol)
-        if not decoded_input.endswith(self._eol) and len(decoded_lines) > 0:
-            # last bit didn't yet have a terminator. Buffer it for the next
-            # go around
-            local_storage.line_buffer = decoded_lines[-1]
-            decoded_lines = decoded_lines[:-1]
-        for decoded_line in decoded_lines:
-            try:
-                timestamped_line = TimestampedLine.create(decoded_line, rx_timestamp_seconds)
-                self._read_buffer.put_nowait(timestamped_line)
-                if self._extra_verbose:
-                    self._logger_rx.debug(re.sub('\\r', '<cr>', timestamped_line))
-            except queue.Full:
-                self._logger_rx.warning("read buffer overflow.")
-                self._rx_buffer_overflows += 1
+        rx_accumulator += raw_input
+        # Split the raw bytes and only decode complete lines. UTF-8 never uses the (ASCII) line ending
+        # bytes within a multi-byte sequence so this is safe and each line is decoded exactly once.
+        raw_lines = rx_accumulator.split(self._eol_bytes)
+        if len(raw_lines) == 1:
+            # last bit didn't yet have a terminator. It stays buffered for the next go around.
+            return
+        rx_accumulator[:] = raw_lines[-1]
+        read_buffer = self._read_buffer
+        read_buffer_append = read_buffer.append
+        log_lines = self._extra_verbose and self._logger_rx.isEnabledFor(logging.DEBUG)
+        overflows = 0
+        for raw_line in raw_lines[:-1]:
+            if len(read_buffer) == read_buffer.maxlen:
+                overflows += 1
+            timestamped_line = TimestampedLine(raw_line.decode('utf-8', 'replace'), rx_timestamp_seconds)
+            read_buffer_append(timestamped_line)
+            if log_lines:
+                self._logger_rx.debug(timestamped_line.replace('\r', '<cr>'))
+        if overflows > 0:
+            self._logger_rx.warning("read buffer overflow. Dropped %d line(s).", overflows)
+            self._rx_buffer_overflows += overflows
+        self._notify_rx_waiters()
 
     def _buffer_output(self) -> None:
         try:
             while self._queues_are_running:
                 self._buffer_output_step()
+        except Exception as e:
+            self._set_serial_thread_exception(e)
         finally:
             if self._queues_are_running:
                 self._logger_tx.error("write thread exiting.")
             self._queues_are_running = False
 
     def _buffer_output_step(self) -> None:
+        # Block for the first line then drain anything else already queued so it all goes out in a
+        # single write to the port.
+        writelines = [self._write_buffer.get(block=True)]
         try:
-            writeline = self._write_buffer.get(block=True)
-            if writeline != self.WriteBufferEndOfTransmission:
-                self._s.write(self._tx_encoder.encode(writeline))
-                if self._echo:
-                    self._logger_tx.info(re.sub('\\r', '<cr>', writeline))
+            while writelines[-1] != self.WriteBufferEndOfTransmission:
+                writelines.append(self._write_buffer.get_nowait())
         except queue.Empty:
             pass
+        if writelines[-1] == self.WriteBufferEndOfTransmission:
+            writelines.pop()
+        if len(writelines) == 0:
+            return
+        self._s.write(b''.join(self._tx_encoder.encode(writeline) for writeline in writelines))
+        if self._echo and self._logger_tx.isEnabledFor(logging.INFO):
+            for writeline in writelines:
+                self._logger_tx.info(writeline.replace('\r', '<cr>'))
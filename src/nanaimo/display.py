@@ -36,6 +36,13 @@ class _CharacterDisplayInterface:
     def __init__(self) -> None:
         pass
 
+    @property
+    def is_active(self) -> bool:
+        """
+        False if this is the null display (i.e. there is no display hardware to write to).
+        """
+        return False
+
     def write(self, input_line: typing.Union[typing.List[str], str]) -> None:
         """
         Write text to the display.
@@ -48,6 +55,12 @@ class _CharacterDisplayInterface:
         """
         pass
 
+    def set_text(self, input_line: typing.Union[typing.List[str], str], clear_first: bool = True) -> None:
+        """
+        Write text to the display, optionally clearing it first, as a single transfer.
+        """
+        pass
+
     def set_default_message(self, message: str) -> None:
         """
         Set the message to display when the screen is cleared.
@@ -106,20 +119,34 @@ class _CharacterDisplayAdafruitSerialBackpack(_CharacterDisplayInterface):
     # +-----------------------------------------------------------------------+
     # | CharacterDisplay
     # +-----------------------------------------------------------------------+
+    @property
+    def is_active(self) -> bool:
+        return True
+
     def write(self, input_line: typing.Union[typing.List[str], str]) -> None:
+        self._uart.write(self._encode_lines(input_line))
+
+    def clear(self, display_default_message: bool = True) -> None:
+        self._uart.write(b'\xFE\x58')
+        if display_default_message and self._default_message is not None:
+            self.write(self._default_message)
+
+    def set_text(self, input_line: typing.Union[typing.List[str], str], clear_first: bool = True) -> None:
+        command = bytearray(b'\xFE\x58') if clear_first else bytearray()
+        command += self._encode_lines(input_line)
+        self._uart.write(command)
+
+    def _encode_lines(self, input_line: typing.Union[typing.List[str], str]) -> bytearray:
         if not isinstance(input_line, list):
             lines = self._wrapper.wrap(input_line)
         else:
             lines = input_line
 
+        encoded = bytearray()
         for line_number in range(0, len(lines)):
-            self._uart.write(bytes([0xFE, 0x47, 0x01, line_number + 1]))
-            self._uart.write(lines[line_number].encode('ascii'))
-
-    def clear(self, display_default_message: bool = True) -> None:
-        self._uart.write(b'\xFE\x58')
-        if display_default_message and self._default_message is not None:
-            self.write(self._default_message)
+            encoded += bytes([0xFE, 0x47, 0x01, line_number + 1])
+            encoded += lines[line_number].encode('ascii')
+        return encoded
 
     # +-----------------------------------------------------------------------+
     # | ADAFRUIT USB+SERIAL LCD BACKPACK
@@ -205,6 +232,14 @@ class CharacterDisplay(nanaimo.fixtures.Fixture):
             'fail': [255, 0, 0]
         }
 
+    @property
+    def is_active(self) -> bool:
+        """
+        True if a display was found. When False all display methods are no-ops so callers can skip
+        formatting text for the display entirely.
+        """
+        return self._impl.is_active
+
     def write(self, input_line: str) -> None:
         """
         Write text to the display.
@@ -223,6 +258,16 @@ class CharacterDisplay(nanaimo.fixtures.Fixture):
         except serial.SerialException:
             pass
 
+    def set_text(self, input_line: str, clear_first: bool = True) -> None:
+        """
+        Write text to the display, optionally clearing it first. Unlike calling :meth:`clear` and then
+        :meth:`write` this sends the clear and the text to the display in a single transfer.
+        """
+        try:
+            self._impl.set_text(input_line, clear_first)
+        except serial.SerialException:
+            pass
+
     def configure(self) -> None:
         """
         Configure the display using the arguments provided to this object.
@@ -20,7 +20,6 @@
 import asyncio
 import contextlib
 import pathlib
-import re
 import typing
 
 import nanaimo
@@ -285,7 +284,7 @@ class Series1900BUart(nanaimo.fixtures.Fixture):
             is_command = True
             self.logger.debug('Sending command %s (help=%s)', command, command_help)
         except KeyError:
-            self.logger.debug('Sending characters %s', re.sub('\\r', '<cr>', command))
+            self.logger.debug('Sending characters %s', command.replace('\r', '<cr>'))
             is_command = False
 
         puttime_secs = await uart.put_line(command + '\r')
@@ -24,24 +24,37 @@ import typing
 
 import nanaimo.connections
 
+try:
+    # Use the linear-time RE2 engine when it's installed. The completion pattern is plain enough
+    # for either engine.
+    import re2 as _re_engine  # type: typing.Any
+except ImportError:
+    _re_engine = re
+
 
 class Parser:
     """
     Uses a given monitor to watch for google test results.
     """
 
+    completion_pattern = _re_engine.compile(r'\[\s*(PASSED|FAILED)\s*\]\s*(\d+)\s+tests?\.')
+
     def __init__(self, timeout_seconds: float, loop: typing.Optional[asyncio.AbstractEventLoop] = None):
-        self._loop = (loop if loop is not None else asyncio.get_event_loop())
+        self._loop = loop
         self._logger = logging.getLogger(__name__)
         self._timeout_seconds = timeout_seconds
-        self._completion_pattern = re.compile(r'\[\s*(PASSED|FAILED)\s*\]\s*(\d+)\s+tests?\.')
 
     async def read_test(self, uart: nanaimo.connections.AbstractAsyncSerial) -> int:
-        start_time = self._loop.time()
+        # Use the loop that is running this coroutine unless one was given to the constructor. Within
+        # a coroutine get_event_loop returns the running loop.
+        loop = (self._loop if self._loop is not None else asyncio.get_event_loop())
+        loop_time = loop.time
+        start_time = loop_time()
         result = 1
         line_count = 0
+        debug_enabled = self._logger.isEnabledFor(logging.DEBUG)
         while True:
-            now = self._loop.time()
+            now = loop_time()
             if now - start_time > self._timeout_seconds:
                 result = 2
                 break
@@ -50,17 +63,20 @@ class Parser:
             except asyncio.TimeoutError:
                 result = 2
                 break
-            self._logger.debug(line)
+            if debug_enabled:
+                self._logger.debug(line)
             line_count += 1
-            line_match = self._completion_pattern.match(line)
+            # Match one line at a time so lines received after the summary stay buffered for the caller.
+            line_match = self.completion_pattern.match(line)
             if line_match is not None:
                 result = (0 if line_match.group(1) == 'PASSED' else 1)
                 break
         if 0 == result:
-            self._logger.info('Detected successful test after %f seconds.', self._loop.time() - start_time)
+            self._logger.info('Detected successful test after %f seconds.', loop_time() - start_time)
         elif 2 == result:
-            self._logger.warning('gtest.Parser timeout after %f seconds', self._loop.time() - start_time)
-        self._logger.debug('Processed %d lines. There were %d buffer full events reported.',
-                           line_count,
-                           uart.rx_buffer_overflows)
+            self._logger.warning('gtest.Parser timeout after %f seconds', loop_time() - start_time)
+        if debug_enabled:
+            self._logger.debug('Processed %d lines. There were %d buffer full events reported.',
+                               line_count,
+                               uart.rx_buffer_overflows)
         return result
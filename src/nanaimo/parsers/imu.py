@@ -20,7 +20,6 @@
 """
 The parsers for popular data formats used by IMUs.
 """
-import codecs
 import re
 import typing
 
@@ -124,7 +123,7 @@ class YPR:
         self._record_callback = on_record
         self.eol = line_ending
         self._line_buffer = ''
-        self._decoder = codecs.getincrementaldecoder('ascii')('strict')
+        self._line_buffer_length = 0
         self.reset()
 
     def reset(self) -> None:
@@ -143,24 +142,36 @@ class YPR:
         return None
 
     def push_bytes(self, ypr_bytes: bytes) -> None:
-        decoded = self._decoder.decode(ypr_bytes)
-        decoded_w_buffer = self._line_buffer + decoded
-        self._line_buffer = ''
-        lines = decoded_w_buffer.split(self.eol)
-
-        if not decoded.endswith(self.eol):
-            if len(lines) > 0:
-                self._line_buffer = lines[-1]
-                lines = lines[:-1]
-            else:
-                self._line_buffer = decoded
+        # ASCII has no multi-byte sequences so there is no decoder state to carry between chunks.
+        decoded = ypr_bytes.decode('ascii')
+        eol = self.eol
+        eol_length = len(eol)
+
+        # Include the end of the buffered partial line so a line ending split across two chunks is found.
+        eol_search_start = max(0, len(self._line_buffer) - (eol_length - 1))
+        if eol not in self._line_buffer[eol_search_start:] + decoded:
+            # Still within a partial line. Track its length with a running count so we can discard
+            # runaway data before concatenating it onto the buffer.
+            self._line_buffer_length += len(decoded)
+            if not self._discard_if_too_long():
+                self._line_buffer += decoded
+            return
 
-            if len(self._line_buffer) > self.max_line_length:
-                # ASCII == 8 bits
-                self.bytes_discarded += len(self._line_buffer)
-                self._line_buffer = ''
+        decoded_w_buffer = self._line_buffer + decoded
 
-        for line in lines:
+        # The last line ending in the chunk marks the end of the complete lines. Anything after it is a
+        # partial line to buffer for the next push.
+        complete_end = decoded_w_buffer.rfind(eol)
+        self._line_buffer = decoded_w_buffer[complete_end + eol_length:]
+        self._line_buffer_length = len(self._line_buffer)
+        self._discard_if_too_long()
+
+        # Walk the complete lines one at a time rather than materializing them all with split.
+        line_start = 0
+        while line_start <= complete_end:
+            line_end = decoded_w_buffer.find(eol, line_start)
+            line = decoded_w_buffer[line_start:line_end]
+            line_start = line_end + eol_length
             try:
                 ypr = self.parse_line(line)
                 if ypr is None:
@@ -169,3 +180,12 @@ class YPR:
                     self._record_callback(ypr)
             except ValueError:
                 self.line_errors += 1
+
+    def _discard_if_too_long(self) -> bool:
+        if self._line_buffer_length > self.max_line_length:
+            # ASCII == 8 bits
+            self.bytes_discarded += self._line_buffer_length
+            self._line_buffer = ''
+            self._line_buffer_length = 0
+            return True
+        return False
@@ -91,8 +91,9 @@ the core nanaimo pytest plugin. For example, assuming you have ``nanaimo.pytest.
 
 """
 import asyncio
+import functools
+import inspect
 import logging
-import re
 import textwrap
 import typing
 
@@ -103,7 +104,11 @@ import pytest
 import nanaimo
 import nanaimo.config
 import nanaimo.fixtures
-import nanaimo.display
+
+if typing.TYPE_CHECKING:
+    # The display is registered through its own pytest11 entry point and is only named in annotations here.
+    # Importing it eagerly would pull pyserial and the connections package into every pytest run.
+    import nanaimo.display  # noqa: F401
 
 
 def create_pytest_fixture(request: typing.Any, fixture_name: str) -> 'nanaimo.fixtures.Fixture':
@@ -147,10 +152,10 @@ def nanaimo_fixture_manager(request: typing.Any) \
     return PytestFixtureManager(request.config.pluginmanager)
 
 
-@pytest.fixture
-def nanaimo_arguments(request: typing.Any) -> nanaimo.Namespace:
+@pytest.fixture(scope='session')
+def nanaimo_arguments(pytestconfig: typing.Any) -> nanaimo.Namespace:
     """
-    Exposes the commandline arguments and defaults provided to a test.
+    Exposes the commandline arguments and defaults provided to a test. This fixture is session scoped.
 
     .. invisible-code-block: python
 
@@ -162,12 +167,12 @@ def nanaimo_arguments(request: typing.Any) -> nanaimo.Namespace:
         def test_example(nanaimo_arguments: nanaimo.Namespace) -> None:
             an_argument = nanaimo_arguments.some_arg
 
-    :param pytest_request: The request object passed into the pytest fixture factory.
-    :type pytest_request: _pytest.fixtures.FixtureRequest
+    :param pytestconfig: The pytest config object for the session.
+    :type pytestconfig: _pytest.config.Config
     :return: A namespace with the pytest commandline args added per the documented rules.
     :rtype: nanaimo.Namespace
     """
-    return nanaimo.Namespace(request.config.option)
+    return nanaimo.Namespace(pytestconfig.option)
 
 
 @pytest.fixture
@@ -207,7 +212,16 @@ def nanaimo_log(request: typing.Any) -> logging.Logger:
     :return: A logger for use by Nanaimo tests.
     :rtype: logging.Logger
     """
-    return logging.getLogger(request.function.__name__)
+    return _get_test_logger(request.function.__name__)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_test_logger(name: str) -> logging.Logger:
+    """
+    Memoized :func:`logging.getLogger` so repeated and parametrized tests don't take the logging
+    module's lock to look up the same logger.
+    """
+    return logging.getLogger(name)
 
 
 # +---------------------------------------------------------------------------+
@@ -356,18 +370,54 @@ class PytestFixtureManager(nanaimo.fixtures.FixtureManager):
 # | INTERNALS :: INTEGRATED DISPLAY
 # +---------------------------------------------------------------------------+
 
-_display_singleton = None  # type: typing.Optional[nanaimo.display.CharacterDisplay]
+class _SessionFixtureManager(nanaimo.fixtures.FixtureManager):
+    """
+    :class:`FixtureManager <nanaimo.fixtures.FixtureManager>` for fixtures owned by the pytest session itself
+    (i.e. the integrated display). These fixtures are not normally gathered so the event loop is only created
+    if something asks for it. The loop is owned by this manager and is closed by :meth:`close`.
+    """
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def close(self) -> None:
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+
+def _get_display_type(config: _pytest.config.Config) -> typing.Type['nanaimo.display.CharacterDisplay']:
+    """
+    Resolves the character display fixture type using the synthetic plugin :func:`pytest_addoption` registered
+    for it under its canonical name.
+    """
+    display_plugin = config.pluginmanager.get_plugin('character_display')
+    if display_plugin is None:
+        raise KeyError('character_display fixture was not found.')
+    return typing.cast(typing.Type['nanaimo.display.CharacterDisplay'], display_plugin.fixture_type)
+
+
+_display_sneaky_key = '_nanaimo_display'
+"""
+An attribute we add to the session's :class:`_pytest.config.Config` instance to hold the display
+for that session so per-test hooks can use it directly.
+"""
 
 
 def _get_display(config: _pytest.config.Config) -> 'nanaimo.display.CharacterDisplay':
-    global _display_singleton
-    if _display_singleton is None:
-        for fixture_type in config.pluginmanager.hook.pytest_nanaimo_fixture_type():
-            if fixture_type.get_canonical_name() == 'character_display':
-                _display_singleton = fixture_type(nanaimo.fixtures.FixtureManager(asyncio.get_event_loop()))
-        if _display_singleton is None:
-            raise KeyError('character_display fixture was not found.')
-    return _display_singleton
+    """
+    Returns the display for a given pytest session. The display is created on the first call for a
+    given config and the same instance is returned thereafter. Its :class:`_SessionFixtureManager` is
+    closed by :func:`pytest_sessionfinish`.
+    """
+    display = getattr(config, _display_sneaky_key, None)
+    if display is None:
+        display = _get_display_type(config)(_SessionFixtureManager())
+        setattr(config, _display_sneaky_key, display)
+    return display
 
 
 # +---------------------------------------------------------------------------+
@@ -399,33 +449,65 @@ class _NanaimoItem(pytest.Item):
     fixture artifacts for later reporting in the terminal.
     """
 
+    nanaimo_args_sneaky_key = '_nanaimo_nait_args'
+    """
+    An attribute we add to the session's :class:`_pytest.config.Config` instance to share the
+    arguments given to fixtures across all synthesized items.
+    """
+
     def __init__(self, parent, fixture_names):
-        super().__init__('nanaimo : {}'.format(str(fixture_names)), parent)
+        super().__init__('nanaimo : {}'.format(str(list(fixture_names))), parent)
         self._logger = logging.getLogger(__name__)
-        self._fixture_names = fixture_names
+        self._fixture_names = tuple(fixture_names)
+        self._fixture_key = ','.join(fixture_names)
 
     def on_setup(self) -> None:
-        if not hasattr(self.session.config, self.nanaimo_results_sneaky_key):
+        if getattr(self.session.config, self.nanaimo_results_sneaky_key, None) is None:
             setattr(self.session.config, self.nanaimo_results_sneaky_key, dict())
+        if getattr(self.session.config, self.nanaimo_args_sneaky_key, None) is None:
+            nanaimo_defaults = nanaimo.config.ArgumentDefaults.create_defaults_with_early_rc_config()
+            setattr(self.session.config,
+                    self.nanaimo_args_sneaky_key,
+                    nanaimo.Namespace(self.session.config.option, nanaimo_defaults))
 
     def runtest(self) -> None:
         """
         Run all fixtures specified on the command-line.
         """
-        loop = asyncio.get_event_loop()
-        fixtures = []
-        nanaimo_defaults = nanaimo.config.ArgumentDefaults.create_defaults_with_early_rc_config()
-        nanaimo_args = nanaimo.Namespace(self.session.config.option, nanaimo_defaults)
-        fixture_manager = PytestFixtureManager(self.config.pluginmanager, loop)
-        for fixture_name in self._fixture_names:
-            fixtures.append(fixture_manager.create_fixture(fixture_name, nanaimo_args))
-        gathers = [asyncio.ensure_future(f.gather()) for f in fixtures]
-        results = loop.run_until_complete(asyncio.gather(*gathers, loop=loop))
-        combined = nanaimo.Artifacts.combine(*results)
-        assert combined.result_code == 0
-        getattr(self.session.config, self.nanaimo_results_sneaky_key)[','.join(self._fixture_names)] = combined
-        for fixture in fixtures:
-            fixture.on_test_teardown('nait')
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            nanaimo_args = getattr(self.session.config, self.nanaimo_args_sneaky_key)
+            fixture_manager = PytestFixtureManager(self.config.pluginmanager, loop)
+            fixtures = [fixture_manager.create_fixture(fixture_name, nanaimo_args)
+                        for fixture_name in self._fixture_names]
+            results = self._gather_fail_fast(loop, fixtures)
+            combined = nanaimo.Artifacts.combine(*results)
+            assert combined.result_code == 0
+            getattr(self.session.config, self.nanaimo_results_sneaky_key)[self._fixture_key] = combined
+            for fixture in fixtures:
+                fixture.on_test_teardown('nait')
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    @staticmethod
+    def _gather_fail_fast(loop: asyncio.AbstractEventLoop,
+                          fixtures: typing.List[nanaimo.fixtures.Fixture]) -> typing.List[nanaimo.Artifacts]:
+        """
+        Gathers all fixtures concurrently but, as soon as any one of them raises, cancels the rest
+        and re-raises rather than waiting for the remaining fixtures to complete.
+        """
+        tasks = [loop.create_task(f.gather()) for f in fixtures]
+        done, pending = loop.run_until_complete(asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION))
+        if len(pending) > 0:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise typing.cast(BaseException, task.exception())
+        return [task.result() for task in tasks]
 
     def _prunetraceback(self, excinfo):
         """
@@ -441,17 +523,43 @@ class _NanaimoItem(pytest.Item):
 # +---------------------------------------------------------------------------+
 
 
+_args_ns_sneaky_key = '_nanaimo_args_ns'
+"""
+An attribute we add to the session's :class:`_pytest.config.Config` instance to hold the
+:class:`nanaimo.Namespace` built from that session's options.
+"""
+
+
+def _get_args_ns(config: _pytest.config.Config) -> nanaimo.Namespace:
+    """
+    Returns the :class:`nanaimo.Namespace` (with :class:`nanaimo.config.ArgumentDefaults`) for the options of a
+    given pytest session. The namespace is created on the first call for a given config and the same instance is
+    returned thereafter.
+    """
+    args_ns = getattr(config, _args_ns_sneaky_key, None)
+    if args_ns is None:
+        args_ns = nanaimo.Namespace(config.option,
+                                    nanaimo.config.ArgumentDefaults(config.option),
+                                    allow_none_values=False)
+        setattr(config, _args_ns_sneaky_key, args_ns)
+    return args_ns
+
+
 class _SyntheticPlugin:
     """
     Used to synthesize a pytest plugin with the same name as a fixture's canonical name.
     """
 
-    _RemoveInvisiblesPattern = re.compile(r'\.\.\s+invisible-code-block:.*\n(?:[\n]|\s{4,}.*\n)+')
+    _cleaned_docstrings = dict()  # type: typing.Dict[typing.Type['nanaimo.fixtures.Fixture'], str]
+    """
+    Cleaned fixture docstrings by fixture type so each docstring is only processed once per process.
+    """
 
-    def __init__(self, fixture_type):
+    def __init__(self, fixture_type, fixture_type_name=None):
         self._fixture_type = fixture_type
 
-        fixture_type_name = fixture_type.get_canonical_name()
+        if fixture_type_name is None:
+            fixture_type_name = fixture_type.get_canonical_name()
 
         def _generic_async_fixture(request, nanaimo_fixture_manager):
             fixture = self._create_pytest_fixture(request, nanaimo_fixture_manager, fixture_type)
@@ -461,9 +569,7 @@ class _SyntheticPlugin:
                     fixture.get_canonical_name()))
             return fixture
 
-        dedent_docstring = textwrap.dedent(fixture_type.__doc__)
-        cleaned_docstring = self._RemoveInvisiblesPattern.sub('', dedent_docstring)
-        _generic_async_fixture.__doc__ = cleaned_docstring
+        _generic_async_fixture.__doc__ = self._get_cleaned_docstring(fixture_type)
         self.__dict__[fixture_type_name] = pytest.fixture(_generic_async_fixture,
                                                           name=fixture_type_name)
 
@@ -471,13 +577,48 @@ class _SyntheticPlugin:
     def fixture_type(self) -> typing.Type['nanaimo.fixtures.Fixture']:
         return self._fixture_type
 
+    @classmethod
+    def _get_cleaned_docstring(cls, fixture_type: typing.Type['nanaimo.fixtures.Fixture']) -> str:
+        try:
+            return cls._cleaned_docstrings[fixture_type]
+        except KeyError:
+            pass
+        docstring = fixture_type.__doc__
+        if not docstring:
+            cleaned_docstring = ''
+        elif 'invisible-code-block:' not in docstring:
+            cleaned_docstring = inspect.cleandoc(docstring)
+        else:
+            cleaned_docstring = cls._remove_invisibles(inspect.cleandoc(docstring))
+        cls._cleaned_docstrings[fixture_type] = cleaned_docstring
+        return cleaned_docstring
+
+    @staticmethod
+    def _remove_invisibles(docstring: str) -> str:
+        """
+        Removes ``.. invisible-code-block:`` directives, and the indented or blank lines that follow them,
+        from a docstring. This is a single pass over the lines of the docstring.
+        """
+        kept_lines = []  # type: typing.List[str]
+        in_invisible_block = False
+        for line in docstring.splitlines(keepends=True):
+            if in_invisible_block:
+                if line.strip() == '' or line[:4].isspace():
+                    continue
+                in_invisible_block = False
+            stripped = line.lstrip()
+            if stripped.startswith('..') and stripped[2:].lstrip().startswith('invisible-code-block:'):
+                kept_lines.append(line[:len(line) - len(stripped)])
+                in_invisible_block = True
+            else:
+                kept_lines.append(line)
+        return ''.join(kept_lines)
+
     def _create_pytest_fixture(self,
                                pytest_request: typing.Any,
                                nanaimo_fixture_manager: nanaimo.fixtures.FixtureManager,
                                fixture_type: typing.Type['nanaimo.fixtures.Fixture']) -> nanaimo.fixtures.Fixture:
-        args = pytest_request.config.option
-        args_ns = nanaimo.Namespace(args, nanaimo.config.ArgumentDefaults(args), allow_none_values=False)
-        return fixture_type(nanaimo_fixture_manager, args_ns)
+        return fixture_type(nanaimo_fixture_manager, _get_args_ns(pytest_request.config))
 
 
 def pytest_addoption(parser: '_pytest.config.argparsing.Parser', pluginmanager: '_pytest.config.PytestPluginManager')\
@@ -538,12 +679,18 @@ def pytest_addoption(parser: '_pytest.config.argparsing.Parser', pluginmanager:
     # so they can contribute options.
     pluginmanager.load_setuptools_entrypoints('pytest11')
 
+    # set_inner_arguments depends on each fixture's group so it has to stay in the loop but the canonical
+    # name is only computed once per fixture type and the synthetic plugins are registered in a single pass.
+    synthetic_plugins = []  # type: typing.List[typing.Tuple[_SyntheticPlugin, str]]
     for fixture_type in pluginmanager.hook.pytest_nanaimo_fixture_type():
-        pluginmanager.register(_SyntheticPlugin(fixture_type), fixture_type.get_canonical_name())
-        group = parser.getgroup(fixture_type.get_canonical_name())
-        nanaimo_arguments.set_inner_arguments(group)
+        canonical_name = fixture_type.get_canonical_name()
+        synthetic_plugins.append((_SyntheticPlugin(fixture_type, canonical_name), canonical_name))
+        nanaimo_arguments.set_inner_arguments(parser.getgroup(canonical_name))
         fixture_type.visit_test_arguments(nanaimo_arguments)
 
+    for synthetic_plugin, canonical_name in synthetic_plugins:
+        pluginmanager.register(synthetic_plugin, canonical_name)
+
 
 def pytest_addhooks(pluginmanager):
     """
@@ -565,12 +712,10 @@ def pytest_collection(session: _pytest.main.Session):
     if is_nait_mode():
         f = pytest.File(py.path.local(__file__), session)
         if session.config.option.concurrent:
-            session.items = [_NanaimoItem(f, session.config.option.file_or_dir.copy())]
+            session.items = [_NanaimoItem(f, session.config.option.file_or_dir)]
             session.testscollected = 1
         else:
-            session.items = []
-            for fixture_name in session.config.option.file_or_dir:
-                session.items.append(_NanaimoItem(f, [fixture_name]))
+            session.items = [_NanaimoItem(f, (fixture_name,)) for fixture_name in session.config.option.file_or_dir]
             session.testscollected = len(session.items)
         return True
 
@@ -581,9 +726,7 @@ def pytest_sessionstart(session: _pytest.main.Session) -> None:
     Also see the "`Writing Plugins <https://docs.pytest.org/en/latest/writing_plugins.html>`_"
     guide.
     """
-    args = session.config.option
-    args_ns = nanaimo.Namespace(args, nanaimo.config.ArgumentDefaults(args), allow_none_values=False)
-    nanaimo.set_subprocess_environment(args_ns)
+    nanaimo.set_subprocess_environment(_get_args_ns(session.config))
     _get_display(session.config).set_status('busy')
 
 
@@ -595,9 +738,9 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
     """
     if isinstance(item, _NanaimoItem):
         item.on_setup()
-    display = _get_display(item.config)
-    display.clear(display_default_message=False)
-    display.write(item.name)
+    display = getattr(item.config, _display_sneaky_key, None)
+    if display is not None and display.is_active:
+        display.set_text(item.name)
 
 
 def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item) -> None:
@@ -622,6 +765,7 @@ def pytest_sessionfinish(session: _pytest.main.Session, exitstatus: int) -> None
     display = _get_display(session.config)
     display.clear(display_default_message=True)
     display.set_status('okay' if exitstatus == 0 else 'fail')
+    typing.cast(_SessionFixtureManager, display.manager).close()
 
 # +---------------------------------------------------------------------------+
 # | INTERNALS :: PYTEST HOOKS :: REPORTING
@@ -646,8 +790,10 @@ def pytest_terminal_summary(terminalreporter: '_pytest.terminal.TerminalReporter
     guide.
     """
     terminalreporter.write_sep('-', title='nanaimo', bold=True)
-    if hasattr(config, _NanaimoItem.nanaimo_results_sneaky_key):
-        results = getattr(config, _NanaimoItem.nanaimo_results_sneaky_key)  # type: typing.Dict[str, nanaimo.Artifacts]
+    results = getattr(config,
+                      _NanaimoItem.nanaimo_results_sneaky_key,
+                      None)  # type: typing.Optional[typing.Dict[str, nanaimo.Artifacts]]
+    if results is not None:
         for fixture_names, artifacts in results.items():
             terminalreporter.write_line('Fixture(s) "{}" result = {}'.format(fixture_names, artifacts.result_code),
                                         green=(artifacts.result_code == 0),
@@ -655,7 +801,6 @@ def pytest_terminal_summary(terminalreporter: '_pytest.terminal.TerminalReporter
 
         for fixture_names, artifacts in results.items():
             terminalreporter.write_sep('.', title='Artifacts for {}'.format(fixture_names), bold=False)
-            artifact_vars = vars(artifacts)
-            for key, value in artifact_vars.items():
+            for key, value in artifacts.__dict__.items():
                 if not key.startswith('_'):
                     terminalreporter.write_line('{}={}'.format(key, value))
@@ -2,39 +2,96 @@
 # Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # This software is distributed under the terms of the MIT License.
 #
-import asyncio
 import os
 import pathlib
+import shutil
 import subprocess
+import sys
 import typing
 
 import pytest
 
 import material
-import material.simulators
 import nanaimo
 import nanaimo.config
 import nanaimo.fixtures
 
 
+_material_dir = pathlib.Path(material.__file__).parent
+_root_dir = _material_dir.parent.parent
+_test_cfg = _material_dir / 'test.cfg'
+_local_setup_cfg = _root_dir / 'setup.cfg'
+_mock_JLinkExe = _material_dir / 'mock_JLinkExe.py'
+_test_build_config_hex = _material_dir / 'test_build_config.hex'
+_test_jlink_template = _material_dir / 'test.jlink'
+_build_output = _root_dir / 'build'
+
+_coverage_nait_command = ['coverage', 'run', '--parallel-mode', '--rcfile={}'.format(str(_local_setup_cfg)),
+                          '-m', 'nanaimo']
+
+_nait_command = (_coverage_nait_command
+                 if os.environ.get('NANAIMO_TEST_NO_COVERAGE', '0') != '1' and shutil.which('coverage') is not None
+                 else [sys.executable, '-m', 'nanaimo'])
+"""
+nait subprocesses run under coverage unless coverage isn't installed or NANAIMO_TEST_NO_COVERAGE=1 is set.
+Skipping coverage saves its startup and tracing cost for each nait invocation in local test cycles.
+"""
+
+_inprocess_nait = (os.environ.get('NANAIMO_TEST_INPROCESS_NAIT', '0') == '1')
+"""
+Set NANAIMO_TEST_INPROCESS_NAIT=1 to run nait within the test process rather than forking a coverage
+wrapped interpreter for each invocation. This is much faster but nait runs pytest so the nested session
+shares this process' modules and logging configuration.
+"""
+
+
+def _run_nait_inprocess(capfd: typing.Any,
+                        args: typing.List[str],
+                        check_result: bool,
+                        capture_stdout: bool) -> subprocess.CompletedProcess:
+    import nanaimo.cli
+    import nanaimo.pytest.plugin
+
+    saved_argv = sys.argv
+    saved_nait_mode = nanaimo.pytest.plugin._nait_mode
+    sys.argv = ['nait'] + args
+    capfd.readouterr()
+    try:
+        try:
+            returncode = int(nanaimo.cli.main())
+        except SystemExit as e:
+            returncode = (e.code if isinstance(e.code, int) else 0 if e.code is None else 1)
+    finally:
+        sys.argv = saved_argv
+        nanaimo.pytest.plugin._nait_mode = saved_nait_mode
+    stdout = capfd.readouterr().out
+    result = subprocess.CompletedProcess(['nait'] + args,
+                                         returncode,
+                                         stdout=(stdout.encode('utf-8') if capture_stdout else None))
+    if check_result:
+        result.check_returncode()
+    return result
+
+
 @pytest.fixture
 def run_nait(request):  # type: ignore
     def _run_nait(args: typing.List[str],
                   check_result: bool = True,
-                  env: typing.Optional[typing.Dict[str, str]] = None) -> subprocess.CompletedProcess:
+                  env: typing.Optional[typing.Dict[str, str]] = None,
+                  capture_stdout: bool = True) -> subprocess.CompletedProcess:
         """
         Helper to invoke nait for unit testing within the proper python coverage wrapper.
+        Set capture_stdout to False when only the return code matters to discard nait's output
+        rather than buffering it.
         """
-        root_dir = pathlib.Path(request.module.__file__).parent.parent
-        setup = root_dir / pathlib.Path('setup').with_suffix('.cfg')
-        coverage_args = ['coverage', 'run', '--parallel-mode', '--rcfile={}'.format(str(setup))]
-        nait = ['-m', 'nanaimo']
-        this_env = os.environ.copy()
-        if env is not None:
-            this_env.update(env)
-        return subprocess.run(coverage_args + nait + args,
+        if _inprocess_nait and env is None:
+            # Environment overrides need a real child process.
+            return _run_nait_inprocess(request.getfixturevalue('capfd'), args, check_result, capture_stdout)
+        # With no overrides the child simply inherits our environment.
+        this_env = (dict(os.environ, **env) if env is not None else None)
+        return subprocess.run(_nait_command + args,
                               check=check_result,
-                              stdout=subprocess.PIPE,
+                              stdout=(subprocess.PIPE if capture_stdout else subprocess.DEVNULL),
                               env=this_env)
     return _run_nait
 
@@ -44,20 +101,19 @@ def paths_for_test(request):  # type: ignore
     return material.Paths(request.module.__file__)
 
 
-@pytest.fixture
-def test_config(request):  # type: ignore
-    return pathlib.Path(material.__file__).parent / pathlib.Path('test').with_suffix('.cfg')
+@pytest.fixture(scope='session')
+def test_config():  # type: ignore
+    return _test_cfg
 
 
-@pytest.fixture
-def local_setup_cfg(request):  # type: ignore
-    return pathlib.Path(material.__file__).parent.parent.parent / pathlib.Path('setup').with_suffix('.cfg')
+@pytest.fixture(scope='session')
+def local_setup_cfg():  # type: ignore
+    return _local_setup_cfg
 
 
 @pytest.fixture
-def nanaimo_defaults(request):  # type: ignore
-    test_cfg = pathlib.Path(material.__file__).parent / pathlib.Path('test').with_suffix('.cfg')
-    return nanaimo.config.ArgumentDefaults(test_cfg)
+def nanaimo_defaults():  # type: ignore
+    return nanaimo.config.ArgumentDefaults(_test_cfg)
 
 
 @pytest.fixture
@@ -65,31 +121,34 @@ def dummy_nanaimo_fixture(request):  # type: ignore
     return material.DummyFixture(nanaimo.fixtures.FixtureManager())
 
 
-@pytest.fixture
-def mock_JLinkExe(request):  # type: ignore
-    return pathlib.Path(material.__file__).parent / pathlib.Path('mock_JLinkExe').with_suffix('.py')
+@pytest.fixture(scope='session')
+def mock_JLinkExe():  # type: ignore
+    return _mock_JLinkExe
 
 
-@pytest.fixture
-def test_build_config_hex(request):  # type: ignore
-    return pathlib.Path(material.__file__).parent / pathlib.Path('test_build_config').with_suffix('.hex')
+@pytest.fixture(scope='session')
+def test_build_config_hex():  # type: ignore
+    return _test_build_config_hex
 
 
-@pytest.fixture
-def test_jlink_template(request):  # type: ignore
-    return pathlib.Path(material.__file__).parent / pathlib.Path('test').with_suffix('.jlink')
+@pytest.fixture(scope='session')
+def test_jlink_template():  # type: ignore
+    return _test_jlink_template
 
 
-@pytest.fixture
-def serial_simulator_type(request):  # type: ignore
+@pytest.fixture(scope='session')
+def serial_simulator_type():  # type: ignore
+    # Only pay for the simulators when a test asks for one.
+    import material.simulators
     return material.simulators.Serial
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def build_output(request):  # type: ignore
-    builddir = pathlib.Path(material.__file__).parent.parent.parent / pathlib.Path('build')
-    if not builddir.exists():
-        builddir.mkdir()
+    # Each pytest-xdist worker gets its own directory so parallel workers don't share outputs.
+    workerinput = getattr(request.config, 'workerinput', None)
+    builddir = (_build_output if workerinput is None else _build_output / workerinput['workerid'])
+    builddir.mkdir(parents=True, exist_ok=True)
     return builddir
 
 
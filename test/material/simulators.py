@@ -15,6 +15,17 @@ import typing
 
 class Serial:
 
+    __slots__ = ('_timeout',
+                 '_fake_data',
+                 '_eol',
+                 '_line_speed_bump',
+                 '_fake_data_index',
+                 '_fake_data_offset',
+                 '_loop_fake_data',
+                 '_read_condition',
+                 '_lines_written',
+                 '_lines_received')
+
     def open(self) -> None:
         pass
 
@@ -42,8 +53,11 @@ class Serial:
     def __init__(self, fake_data: typing.List[str], fake_eol: str = '\r\n', loop_fake_data: bool = True):
         super().__init__()
         self._timeout = 10.0
-        self._fake_data = fake_data
+        # Encode each line, with its line ending, once up front so reads are just slices.
+        self._fake_data = [(fake_line + fake_eol).encode('utf-8') for fake_line in fake_data]
         self._eol = fake_eol
+        # The per-line speed bump has only ever applied to single character line endings.
+        self._line_speed_bump = (len(fake_eol) == 1)
         self._fake_data_index = 0
         self._fake_data_offset = 0
         self._loop_fake_data = loop_fake_data
@@ -55,33 +69,46 @@ class Serial:
         self._fake_data_index = 0
         self._fake_data_offset = 0
 
-    def read(self) -> bytes:
+    @property
+    def in_waiting(self) -> int:
+        """
+        The simulated serial port always has the rest of the current fake line "buffered".
+        """
+        if self._fake_data_index >= len(self._fake_data):
+            return 0
+        return max(0, len(self._fake_data[self._fake_data_index]) - self._fake_data_offset)
+
+    def read(self, size: int = 1) -> bytes:
+        fake_line = self._current_line()
+        if fake_line is None:
+            return b''
+        # Like the real port, return what is buffered (the rest of this line) up to size but at least one byte.
+        start = self._fake_data_offset
+        self._fake_data_offset = min(len(fake_line), start + max(1, size))
+        if self._fake_data_offset == len(fake_line):
+            self._lines_received += 1
+            if self._line_speed_bump:
+                with self._read_condition:
+                    # Put a little speed bump for each line.
+                    self._read_condition.wait(timeout=.01)
+        return fake_line[start:self._fake_data_offset]
+
+    def _current_line(self) -> typing.Optional[bytes]:
         while True:
             if self._fake_data_index >= len(self._fake_data):
-                if self._loop_fake_data:
+                if self._loop_fake_data and len(self._fake_data) > 0:
                     self._fake_data_index = 0
                     self._fake_data_offset = 0
                 else:
                     with self._read_condition:
                         self._read_condition.wait()
-                    return b''
-            fake_line = self._fake_data[self._fake_data_index] + self._eol
+                    return None
+            fake_line = self._fake_data[self._fake_data_index]
             if self._fake_data_offset >= len(fake_line):
                 self._fake_data_index += 1
                 self._fake_data_offset = 0
             else:
-                break
-
-        return_char = fake_line[self._fake_data_offset]
-        if return_char == self._eol:
-            self._lines_received += 1
-            with self._read_condition:
-                # Put a little speed bump for each line.
-                self._read_condition.wait(timeout=.01)
-
-        return_bytes = return_char.encode('utf-8')
-        self._fake_data_offset += 1
-        return return_bytes
+                return fake_line
 
     def write(self, data: bytes) -> None:
         text = data.decode('utf-8')
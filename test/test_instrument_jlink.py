@@ -19,7 +19,7 @@ async def test_jlink_upload(use_internal_template: bool,
                             nanaimo_jlink_upload: nanaimo.fixtures.Fixture,
                             mock_JLinkExe: pathlib.Path,
                             test_build_config_hex: pathlib.Path,
-                            test_jlink_template: pathlib.Path) -> None:
+                            request: typing.Any) -> None:
     """
         Test using the jlink ProgramUploader fixture.
     """
@@ -29,7 +29,8 @@ async def test_jlink_upload(use_internal_template: bool,
         'jlink_up_device': 'fake'}
 
     if not use_internal_template:
-        test_args['jlink_up_script'] = str(test_jlink_template)
+        # Only the external template variant needs the template fixture.
+        test_args['jlink_up_script'] = str(request.getfixturevalue('test_jlink_template'))
         test_args['jlink_up_device'] = None  # fails unless args are optional with script
 
     artifacts = assert_success(await nanaimo_jlink_upload.gather(**test_args))
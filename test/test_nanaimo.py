@@ -4,7 +4,11 @@
 #
 
 import argparse
+import asyncio
+import concurrent.futures
 import os
+import queue
+import threading
 import typing
 from unittest.mock import MagicMock
 
@@ -45,6 +49,21 @@ async def test_failed_test(serial_simulator_type: typing.Type) -> None:
         assert 1 == await nanaimo.parsers.gtest.Parser(10).read_test(monitor)
 
 
+@pytest.mark.timeout(10)
+@pytest.mark.asyncio
+async def test_lines_after_test_result_stay_buffered(serial_simulator_type: typing.Type) -> None:
+    """
+    The gtest parser must not consume lines received after the test summary.
+    """
+    serial = serial_simulator_type(['[  PASSED  ] 1 test.', 'after', 'more'], loop_fake_data=False)
+    with nanaimo.connections.uart.ConcurrentUart(serial) as uart:
+        # Let the reader buffer every line first so the parser has the chance to read past the summary.
+        await asyncio.sleep(0.1)
+        assert 0 == await nanaimo.parsers.gtest.Parser(4.0).read_test(uart)
+        assert 'after' == await uart.get_line(timeout_seconds=4.0)
+        assert 'more' == await uart.get_line(timeout_seconds=4.0)
+
+
 @pytest.mark.asyncio
 async def test_timeout_while_monitoring(serial_simulator_type: typing.Type) -> None:
     serial = serial_simulator_type(['gibberish'], loop_fake_data=False)
@@ -52,6 +71,114 @@ async def test_timeout_while_monitoring(serial_simulator_type: typing.Type) -> N
         assert 0 != await nanaimo.parsers.gtest.Parser(4.0).read_test(monitor)
 
 
+@pytest.mark.timeout(10)
+@pytest.mark.asyncio
+async def test_uart_read_buffer_overflow(serial_simulator_type: typing.Type) -> None:
+    """
+    Verify the oldest received lines are dropped, and counted, once the read buffer is full.
+    """
+    class SmallBufferUart(nanaimo.connections.uart.ConcurrentUart):
+        ReadBufferMaxLines = 2
+
+    with SmallBufferUart(serial_simulator_type(['one', 'two', 'three'], loop_fake_data=False)) as uart:
+        while uart.rx_buffer_overflows == 0:
+            await asyncio.sleep(0.01)
+        assert 1 == uart.rx_buffer_overflows
+        assert 'two' == await uart.get_line(timeout_seconds=4.0)
+        assert 'three' == await uart.get_line(timeout_seconds=4.0)
+
+
+@pytest.mark.asyncio
+async def test_get_line_wakes_for_line_from_another_thread(event_loop: asyncio.AbstractEventLoop) -> None:
+    """
+    A coroutine blocked in get_line is woken when another thread buffers a line.
+    """
+    serial = nanaimo.connections.AbstractAsyncSerial(event_loop)
+
+    def produce() -> None:
+        serial._read_buffer.append(nanaimo.connections.TimestampedLine('hello', serial.time()))
+        serial._notify_rx_waiters()
+
+    producer = threading.Timer(0.05, produce)
+    producer.start()
+    try:
+        assert 'hello' == await serial.get_line(timeout_seconds=4.0)
+    finally:
+        producer.join()
+    assert 0 == len(serial._rx_waiters)
+
+
+@pytest.mark.asyncio
+async def test_get_line_timeout_removes_waiter(event_loop: asyncio.AbstractEventLoop) -> None:
+    serial = nanaimo.connections.AbstractAsyncSerial(event_loop)
+    with pytest.raises(asyncio.TimeoutError):
+        await serial.get_line(timeout_seconds=0.05)
+    assert 0 == len(serial._rx_waiters)
+
+
+@pytest.mark.asyncio
+async def test_notify_skips_waiter_with_closed_loop(event_loop: asyncio.AbstractEventLoop) -> None:
+    """
+    A waiter whose event loop was closed must not stop the other waiters from being woken.
+    """
+    serial = nanaimo.connections.AbstractAsyncSerial(event_loop)
+    closed_loop = asyncio.new_event_loop()
+    serial._rx_waiters.append((closed_loop, closed_loop.create_future()))
+    closed_loop.close()
+    live_waiter = event_loop.create_future()
+    serial._rx_waiters.append((event_loop, live_waiter))
+
+    serial._notify_rx_waiters()
+
+    await asyncio.wait_for(live_waiter, 4.0)
+    assert 0 == len(serial._rx_waiters)
+
+
+@pytest.mark.asyncio
+async def test_uart_reraises_serial_thread_exception(serial_simulator_type: typing.Type) -> None:
+    """
+    An exception on a serial thread (e.g. the port going away) is raised again when the UART context exits.
+    """
+    class FailingSerial(serial_simulator_type):  # type: ignore
+
+        def read(self, size: int = 1) -> bytes:
+            raise OSError('The port went away.')
+
+    with pytest.raises(OSError):
+        with nanaimo.connections.uart.ConcurrentUart(FailingSerial(['unused'])) as uart:
+            with pytest.raises(queue.Empty):
+                await uart.get_line(timeout_seconds=4.0)
+
+
+def test_uart_exit_times_out_on_stuck_serial_thread(serial_simulator_type: typing.Type) -> None:
+    """
+    If a serial thread doesn't stop, exiting the UART context raises rather than closing the port under it.
+    """
+    class StuckSerial(serial_simulator_type):  # type: ignore
+
+        def __init__(self) -> None:
+            super().__init__(['unused'])
+            self.release = threading.Event()
+            self.close_count = 0
+
+        def read(self, size: int = 1) -> bytes:
+            self.release.wait()
+            return b''
+
+        def close(self) -> None:
+            self.close_count += 1
+
+    serial = StuckSerial()
+    serial.timeout = 0.1
+    try:
+        with pytest.raises(concurrent.futures.TimeoutError):
+            with nanaimo.connections.uart.ConcurrentUart(serial):
+                pass
+        assert 0 == serial.close_count
+    finally:
+        serial.release.set()
+
+
 def test_enable_default_from_environ(nanaimo_defaults: nanaimo.config.ArgumentDefaults) -> None:
     a = nanaimo.Arguments(argparse.ArgumentParser(), nanaimo_defaults)
 
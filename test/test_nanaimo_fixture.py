@@ -164,10 +164,10 @@ async def test_gather_timeout(event_loop: asyncio.AbstractEventLoop) -> None:
 
         async def on_gather(self, args: nanaimo.Namespace) -> nanaimo.Artifacts:
             """
-            Sleep forever
+            Wait forever on a future that is never resolved.
             """
-            while True:
-                await asyncio.sleep(1)
+            await asyncio.get_event_loop().create_future()
+            return nanaimo.Artifacts()
 
     subject = GatherTimeoutFixture(nanaimo.fixtures.FixtureManager(), gather_timeout_seconds=2.0)
     assert 2.0 == subject.gather_timeout_seconds
@@ -184,7 +184,7 @@ async def test_subprocess_fixture_logfile(build_output: pathlib.Path) -> None:
     """
     import nanaimo.version
 
-    logfile = build_output / pathlib.Path('test_subprocess_fixture_logfile').with_suffix('.log')
+    logfile = build_output / 'test_subprocess_fixture_logfile.log'
     class SubprocessTestHarness(nanaimo.fixtures.SubprocessFixture):
 
         argument_prefix = 'test-subprocess-fixture'
@@ -45,6 +45,20 @@ def test_line_too_long() -> None:
     assert parser.bytes_discarded == YPR.max_line_length + 1
 
 
+def test_line_ending_split_across_chunks() -> None:
+    """
+    A multi-character line ending split across two chunks still completes the line, even when the
+    rest of the second chunk is long enough to be discarded.
+    """
+    handler = Handler()
+    parser = YPR(handler, '\r\n')
+    parser.push_bytes('#YPR=1,2,3\r'.encode('ascii'))
+    parser.push_bytes(('\n' + 'a' * YPR.max_line_length).encode('ascii'))
+
+    assert len(handler.records) == 1
+    assert handler.records[0] == (1, 2, 3)
+
+
 def test_junk_data() -> None:
     """
     Make sure we continue to parse after encountering unknown data.
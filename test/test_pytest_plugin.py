@@ -3,10 +3,15 @@
 # This software is distributed under the terms of the MIT License.
 #
 
+import asyncio
+import typing
+
 import pytest
 
+import material
 import nanaimo
 import nanaimo.fixtures
+import nanaimo.pytest.plugin
 from nanaimo.pytest.plugin import assert_success
 
 
@@ -45,6 +50,22 @@ async def test_another_nanaimo_bar(nanaimo_fixture_manager: nanaimo.fixtures.Fix
     assert nanaimo_bar.loop.is_running()
 
 
+def test_fixture_manager_loop_outside_asyncio(nanaimo_fixture_manager: nanaimo.fixtures.FixtureManager) -> None:
+    """
+    Read the manager's loop from a test without a running event loop (the next test must not see it).
+    """
+    assert nanaimo_fixture_manager.loop is not None
+
+
+@pytest.mark.asyncio
+async def test_fixture_manager_uses_test_loop(nanaimo_fixture_manager: nanaimo.fixtures.FixtureManager,
+                                              event_loop: typing.Any) -> None:
+    """
+    Each test's fixture manager must use the event loop running that test.
+    """
+    assert nanaimo_fixture_manager.loop is event_loop
+
+
 @pytest.mark.xfail
 def test_assert_success() -> None:
     nanaimo.pytest.plugin.assert_success(nanaimo.Artifacts(1))
@@ -53,3 +74,35 @@ def test_assert_success() -> None:
 @pytest.mark.asyncio
 async def test_plugin_from_conftest(nanaimo_bar_from_conftest: nanaimo.fixtures.Fixture) -> None:
     assert_success(await nanaimo_bar_from_conftest.gather())
+
+
+def test_gather_fail_fast_cancels_pending() -> None:
+    """
+    When one concurrently gathered nait fixture raises the others are cancelled and the exception is re-raised.
+    """
+    class FailingFixture(material.DummyFixture):
+
+        async def on_gather(self, args: nanaimo.Namespace) -> nanaimo.Artifacts:
+            raise RuntimeError('gather failed')
+
+    class PendingFixture(material.DummyFixture):
+
+        was_cancelled = False
+
+        async def on_gather(self, args: nanaimo.Namespace) -> nanaimo.Artifacts:
+            try:
+                await asyncio.get_event_loop().create_future()
+            except asyncio.CancelledError:
+                self.was_cancelled = True
+                raise
+            return nanaimo.Artifacts()
+
+    loop = asyncio.new_event_loop()
+    try:
+        manager = nanaimo.fixtures.FixtureManager(loop)
+        pending_fixture = PendingFixture(manager)
+        with pytest.raises(RuntimeError):
+            nanaimo.pytest.plugin._NanaimoItem._gather_fail_fast(loop, [pending_fixture, FailingFixture(manager)])
+        assert pending_fixture.was_cancelled
+    finally:
+        loop.close()